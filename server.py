@@ -34,16 +34,32 @@ The FastMCP server makes each private request asynchronously using httpx.
 """
 from __future__ import annotations
 
+import asyncio
 import hmac
 import hashlib
+import json
+import logging
 import os
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+import random
+import re
+import socket
+import ssl
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+from urllib.parse import quote_plus
 
 import httpx
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    from json import loads as _json_loads
+
 # ---------------------------------------------------------------------------
 # Environment & global initialisation
 # ---------------------------------------------------------------------------
@@ -60,36 +76,387 @@ if not API_KEY or not API_SECRET:
 
 INDODAX_API_URL = "https://indodax.com/tapi"
 
-mcp = FastMCP("indodax")
+# Pre-key the HMAC once so the SHA-512 key schedule (ipad/opad blocks) is not
+# recomputed on every signed request; `.copy()` per call is cheap.  This
+# assumes API_SECRET does not change after import, which holds because it is
+# read once from the environment above.
+_API_SECRET_BYTES = API_SECRET.encode()
+_HMAC_TEMPLATE = hmac.new(_API_SECRET_BYTES, b"", hashlib.sha512)
+
+# Only `Sign` varies between private requests; build the constant part once.
+_BASE_HEADERS = {
+    "Key": API_KEY,
+    "Content-Type": "application/x-www-form-urlencoded",
+}
+
+logger = logging.getLogger("indodax-mcp")
+
+# hashlib delegates SHA-512 to the linked OpenSSL, which only carries the
+# vectorized (AVX2/SHA-NI) compression cores in the 3.x series.  Warn when the
+# interpreter is linked against something older so a slow signing path is
+# visible in the logs rather than silently degrading every private call.
+if not ssl.OPENSSL_VERSION.startswith("OpenSSL 3"):
+    logger.warning(
+        "Python is linked against %s; HMAC-SHA512 signing will miss the "
+        "accelerated SHA-512 paths available in OpenSSL 3.x",
+        ssl.OPENSSL_VERSION,
+    )
+else:
+    logger.debug("HMAC-SHA512 backend: %s", ssl.OPENSSL_VERSION)
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Server lifespan: warm the connection pool on startup and close pooled
+    HTTP connections on exit."""
+    warmup = asyncio.create_task(_warmup())
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        await _close_clients()
+
+
+mcp = FastMCP("indodax", lifespan=_lifespan)
 
 # ---------------------------------------------------------------------------
 # HTTP utility
 # ---------------------------------------------------------------------------
 
-async def _private_post(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Send a signed POST request to Indodax private endpoint and return JSON.
+# One AsyncClient per event loop so every tool call reuses pooled keep-alive
+# connections instead of paying a fresh TCP+TLS handshake.  Keyed by loop so a
+# restarted stdio server (new loop) transparently gets a new client.
+_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+# HTTP/2 lets concurrent tool calls multiplex over one TLS connection, but
+# httpx only supports it when the optional `h2` package is present
+# (requirements.txt pulls it in via httpx[http2]).  Fall back to HTTP/1.1
+# keep-alive rather than failing at client construction.
+try:
+    import h2  # noqa: F401  (presence check only)
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+    logger.info("h2 not installed; falling back to HTTP/1.1 keep-alive")
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared `httpx.AsyncClient` for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_HTTP2,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=32,
+                keepalive_expiry=60,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def _warmup() -> None:
+    """Pre-resolve DNS and open a pooled connection before the first tool call.
+
+    Moves the fixed DNS + TCP + TLS (and HTTP/2 negotiation) latency off the
+    critical path of the first tool invocation.  Best-effort: failures are
+    logged and the first real call simply connects lazily as before.
+    """
+    try:
+        await asyncio.to_thread(socket.getaddrinfo, "indodax.com", 443)
+        client = _get_client()
+        resp = await client.get(f"{PUBLIC_API_BASE}/server_time")
+        logger.info("connection warmup done over %s", resp.http_version)
+    except Exception as exc:  # noqa: BLE001 - warmup must never break startup
+        logger.debug("connection warmup failed, connecting lazily: %s", exc)
+
+
+async def _close_clients() -> None:
+    """Close every shared client (called from the server lifespan)."""
+    for loop, client in list(_clients.items()):
+        _clients.pop(loop, None)
+        if not client.is_closed:
+            await client.aclose()
+
+
+# Transient upstream failures worth absorbing before surfacing an error to
+# the MCP caller.  Anything else (400s, auth errors) raises immediately.
+_RETRY_STATUSES = frozenset({408, 429, 502, 503, 504})
+_MAX_ATTEMPTS = 3
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float:
+    """Backoff before retry `attempt`, honouring Retry-After when present."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), 10.0)
+            except ValueError:
+                pass
+    return min(2**attempt * 0.1, 2.0) + random.uniform(0, 0.1)
+
+
+# Characters that force a value through percent-encoding.  Indodax payloads
+# are flat dicts of method names, numbers and identifiers, so in practice
+# every value takes the fast path and the body is assembled in one pass.
+_UNSAFE_VALUE_RE = re.compile(r"[^A-Za-z0-9_.\-]")
+
+
+def _encode_payload(
+    payload: Mapping[str, Any],
+    _search=_UNSAFE_VALUE_RE.search,
+    _quote=quote_plus,
+) -> bytes:
+    """Encode `payload` as an `application/x-www-form-urlencoded` body.
+
+    Equivalent to ``urlencode(payload).encode("ascii")`` for the payloads this
+    server produces, but skips the generic quoting machinery for the common
+    all-safe case.  Keys are trusted identifiers and are never quoted.
+    """
+    parts = []
+    for key, value in payload.items():
+        text = value if isinstance(value, str) else str(value)
+        if _search(text):
+            text = _quote(text)
+        parts.append(f"{key}={text}")
+    return "&".join(parts).encode("ascii")
+
+
+def _sign_payload(
+    payload: Mapping[str, Any],
+    _encode=_encode_payload,
+    _mac_copy=_HMAC_TEMPLATE.copy,
+) -> tuple[bytes, str]:
+    """Encode `payload` and compute its hex HMAC-SHA512 signature.
+
+    This is the CPU-bound core of every private call.  The default arguments
+    bind the encoder and the HMAC-template copy once at definition time, so
+    the per-call bytecode carries no global or attribute lookups — the whole
+    body below runs in C except the dict walk in `_encode_payload`.
+    """
+    body = _encode(payload)
+    mac = _mac_copy()
+    mac.update(body)
+    # digest().hex() measured at parity with hexdigest() on CPython
+    # 3.11/3.12 for SHA-512; kept because bytes.hex() is the C path with
+    # the least Python-level indirection.
+    return body, mac.digest().hex()
+
+
+# Wire names for parameters whose pythonic spelling differs (``from`` is a
+# keyword, ``end`` clashes with transHistory's date field).
+_PARAM_REMAP = {"from_id": "from", "end_id": "end"}
+
+
+def _build_payload(method: str, _remap=_PARAM_REMAP.get, **params: Any) -> Dict[str, Any]:
+    """Assemble a private-API payload from keyword arguments.
+
+    `None` and empty-string values are dropped — matching the original
+    per-tool truthiness checks, where an optional argument left as ``""``
+    was omitted from the payload rather than sent as ``key=`` — and
+    pythonic names are remapped to their wire equivalents, so every tool
+    shares one payload-construction path instead of repeating
+    ``if x is not None: payload["x"] = x`` chains.
+
+    Like `_encode_payload`/`_sign_payload`, this runs on every private call
+    and is kept a small, fully typed module-level function with its lookups
+    prebound — the form an AOT compiler (mypyc) could take as-is if this
+    project ever grows a build step for shipping compiled wheels.
+    """
+    payload: Dict[str, Any] = {"method": method}
+    for key, value in params.items():
+        if value is not None and value != "":
+            payload[_remap(key, key)] = value
+    return payload
+
+
+# Private methods that are pure reads: concurrent identical calls can safely
+# share one signed request.  Mutating methods (trade, cancelOrder,
+# withdrawCoin, createVoucher, cancelByClientOrderId) must never coalesce.
+_IDEMPOTENT_METHODS = frozenset({
+    "getInfo",
+    "transHistory",
+    "tradeHistory",
+    "openOrders",
+    "orderHistory",
+    "getOrder",
+    "getOrderByClientOrderId",
+    "withdrawFee",
+    "listDownline",
+    "checkDownline",
+})
+_inflight: Dict[bytes, asyncio.Future] = {}
+
+# Frozen payloads for the zero-argument methods: `_send_private` never
+# mutates its input (the timestamp is merged into a fresh dict per attempt),
+# so these can be shared across calls without a per-call dict literal.
+_GETINFO_PAYLOAD: Mapping[str, Any] = MappingProxyType({"method": "getInfo"})
+_LISTDOWNLINE_PAYLOAD: Mapping[str, Any] = MappingProxyType({"method": "listDownline"})
+
+# Optional micro-batching: private requests arriving within this window are
+# signed back-to-back and dispatched in one gather, amortizing event-loop
+# wakeups when an agent fires several tool calls at once.  Off by default
+# because every call pays the window in added latency; enable by setting
+# e.g. INDODAX_BATCH_WINDOW_MS=2.
+_BATCH_WINDOW = float(os.getenv("INDODAX_BATCH_WINDOW_MS", "0")) / 1000.0
+_batch_queue: list[tuple[Mapping[str, Any], asyncio.Future]] = []
+_batch_flusher: Optional[asyncio.Task] = None
+
+
+async def _flush_batch() -> None:
+    """Wait out the batching window, then sign and send everything queued."""
+    global _batch_flusher
+    await asyncio.sleep(_BATCH_WINDOW)
+    batch = _batch_queue[:]
+    _batch_queue.clear()
+    _batch_flusher = None
+    results = await asyncio.gather(
+        *(_send_private(payload) for payload, _ in batch), return_exceptions=True
+    )
+    for (_, future), result in zip(batch, results):
+        if future.cancelled():
+            continue
+        if isinstance(result, BaseException):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+async def _dispatch_private(payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Send `payload`, going through the micro-batcher when it is enabled."""
+    if _BATCH_WINDOW <= 0:
+        return await _send_private(payload)
+    global _batch_flusher
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _batch_queue.append((payload, future))
+    if _batch_flusher is None or _batch_flusher.done():
+        _batch_flusher = asyncio.create_task(_flush_batch())
+    return await future
+
+
+_last_timestamp = 0
 
-    The function automatically fills `timestamp` (epoch in ms) when `nonce` is
-    not supplied by the caller.
+
+def _next_timestamp() -> int:
+    """Millisecond timestamp guaranteed strictly monotonic per process.
+
+    Burst calls within the same millisecond (and clock steps backwards) would
+    otherwise produce colliding or decreasing nonce values, which the
+    exchange's replay checks can reject.  No lock is needed: callers all run
+    on the event-loop thread and there is no await between read and write.
     """
-    if "timestamp" not in payload and "nonce" not in payload:
-        # millisecond timestamp, compatible with docs default recv window
-        from time import time
-        payload["timestamp"] = int(time() * 1000)
+    global _last_timestamp
+    ts = time.time_ns() // 1_000_000
+    if ts <= _last_timestamp:
+        ts = _last_timestamp + 1
+    _last_timestamp = ts
+    return ts
 
-    body = urlencode(payload)
-    sign = hmac.new(API_SECRET.encode(), body.encode(), hashlib.sha512).hexdigest()
 
-    headers = {
-        "Key": API_KEY,
-        "Sign": sign,
-        "Content-Type": "application/x-www-form-urlencoded",
-    }
+async def _private_post(payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Send a signed POST request to Indodax private endpoint and return JSON.
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(INDODAX_API_URL, headers=headers, data=body)
-        response.raise_for_status()
-        return response.json()
+    Concurrent calls for the same idempotent read (same method and
+    parameters) are coalesced into a single network request; each caller
+    receives the shared response.
+    """
+    if (
+        payload.get("method") not in _IDEMPOTENT_METHODS
+        or "timestamp" in payload
+        or "nonce" in payload
+    ):
+        return await _dispatch_private(payload)
+
+    # Key on the payload before the timestamp is filled in, so identical
+    # logical requests map to the same in-flight slot.
+    key = _encode_payload(payload)
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        # Shield the shared future: cancelling one waiter must not cancel
+        # the in-flight request the other waiters (and the leader) share.
+        return await asyncio.shield(inflight)
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await _dispatch_private(payload)
+    except BaseException as exc:
+        if not future.done():
+            future.set_exception(exc)
+            future.exception()  # mark retrieved; waiters re-raise their own copy
+        raise
+    else:
+        if not future.done():
+            future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+async def _send_private(payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Sign and POST `payload`, filling `timestamp` (epoch ms) when the
+    caller supplied neither `timestamp` nor `nonce`.
+
+    Transient failures (connection errors, 408/429/5xx) are retried with
+    exponential backoff and jitter; the body is re-timestamped and re-signed
+    on each attempt so the replay window never rejects a retry.  Mutating
+    methods only retry when the request provably never reached the server
+    (connect failure) to avoid double-executing an order.
+    """
+    base = payload
+    autofill = "timestamp" not in base and "nonce" not in base
+    idempotent = base.get("method") in _IDEMPOTENT_METHODS
+    client = _get_client()
+
+    for attempt in range(_MAX_ATTEMPTS):
+        if autofill:
+            # millisecond timestamp, compatible with docs default recv window.
+            # Merged into a fresh dict so `base` (possibly a shared frozen
+            # template) is never mutated.
+            payload = {**base, "timestamp": _next_timestamp()}
+
+        body_bytes, sign = _sign_payload(payload)
+
+        headers = _BASE_HEADERS.copy()
+        headers["Sign"] = sign
+
+        last_attempt = attempt + 1 == _MAX_ATTEMPTS
+        try:
+            response = await client.post(
+                _PRIVATE_URL, headers=headers, content=body_bytes
+            )
+            response.raise_for_status()
+        except httpx.ConnectError:
+            if last_attempt:
+                raise
+            delay = _retry_delay(attempt, None)
+        except httpx.TransportError:
+            # The request may have reached the server; only reads are safe
+            # to send again.
+            if last_attempt or not idempotent:
+                raise
+            delay = _retry_delay(attempt, None)
+        except httpx.HTTPStatusError as exc:
+            status = exc.response.status_code
+            if last_attempt or status not in _RETRY_STATUSES:
+                raise
+            if not idempotent and status != 429:
+                raise
+            delay = _retry_delay(attempt, exc.response)
+        else:
+            return _json_loads(response.content)
+
+        logger.warning(
+            "retrying %s in %.2fs (attempt %d/%d)",
+            payload.get("method"), delay, attempt + 1, _MAX_ATTEMPTS,
+        )
+        await asyncio.sleep(delay)
+
+    raise AssertionError("unreachable")  # loop always returns or raises
 
 # ---------------------------------------------------------------------------
 # Public REST API tools (no auth required)
@@ -97,12 +464,175 @@ async def _private_post(payload: Dict[str, Any]) -> Dict[str, Any]:
 
 PUBLIC_API_BASE = "https://indodax.com/api"
 
-async def _public_get(path: str) -> Dict[str, Any]:
-    url = f"{PUBLIC_API_BASE}/{path}"
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.json()
+# Pre-parsed URLs for the fixed endpoints, so the hot path skips httpx's
+# URL parsing (scheme/idna validation, path normalization) on every call.
+# Parameterized paths (ticker/<pair>, trades/<pair>) still parse lazily.
+_PRIVATE_URL = httpx.URL(INDODAX_API_URL)
+_PUBLIC_URLS: Dict[str, httpx.URL] = {
+    name: httpx.URL(f"{PUBLIC_API_BASE}/{name}")
+    for name in (
+        "server_time",
+        "pairs",
+        "price_increments",
+        "summaries",
+        "ticker",
+        "ticker_all",
+        "trades",
+    )
+}
+
+# TTL (seconds) per public endpoint, keyed by the first path segment.  Pair
+# metadata changes on the order of days; tickers/trades are only cached long
+# enough to collapse bursts of identical agent calls.  Unlisted endpoints
+# (e.g. server_time) are never cached.
+_PUBLIC_TTL: Dict[str, float] = {
+    "pairs": 900.0,
+    "price_increments": 900.0,
+    "summaries": 5.0,
+    "ticker": 2.0,
+    "ticker_all": 2.0,
+    "trades": 2.0,
+}
+_public_cache: Dict[str, tuple[float, Any]] = {}
+_public_locks: Dict[str, asyncio.Lock] = {}
+
+# On-disk cache so short-lived stdio server processes do not re-fetch pair
+# metadata on every cold start.  Only endpoints that change on the order of
+# days are persisted; entries carry their own wall-clock expiry.
+_DISK_CACHE_DIR = Path(os.path.expanduser("~/.cache/mcp-indodax"))
+_DISK_TTL: Dict[str, float] = {
+    "pairs": 86400.0,
+    "price_increments": 86400.0,
+}
+
+
+def _disk_cache_path(path: str) -> Path:
+    return _DISK_CACHE_DIR / (path.replace("/", "_") + ".json")
+
+
+def _disk_cache_read(path: str) -> Any:
+    """Return the cached value for `path`, or None when missing/expired.
+
+    Runs in a worker thread (file I/O); any corruption or I/O error is
+    treated as a cache miss.
+    """
+    try:
+        entry = json.loads(_disk_cache_path(path).read_bytes())
+        if time.time() - entry["ts"] < entry["ttl"]:
+            return entry["value"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _disk_cache_write(path: str, value: Any, ttl: float) -> None:
+    """Persist `value` for `path`; failures only cost us the cache."""
+    try:
+        _DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        target = _disk_cache_path(path)
+        tmp = target.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"ts": time.time(), "ttl": ttl, "value": value}))
+        tmp.replace(target)
+    except OSError as exc:
+        logger.debug("disk cache write for %s failed: %s", path, exc)
+
+
+def _disk_cache_clear() -> int:
+    """Delete all persisted cache files, returning how many were removed."""
+    removed = 0
+    try:
+        for file in _DISK_CACHE_DIR.glob("*.json"):
+            file.unlink(missing_ok=True)
+            removed += 1
+    except OSError as exc:
+        logger.debug("disk cache clear failed: %s", exc)
+    return removed
+
+
+async def _fetch_public(path: str) -> Any:
+    """GET a public endpoint, retrying transient failures with backoff."""
+    url = _PUBLIC_URLS.get(path) or httpx.URL(f"{PUBLIC_API_BASE}/{path}")
+    client = _get_client()
+    for attempt in range(_MAX_ATTEMPTS):
+        last_attempt = attempt + 1 == _MAX_ATTEMPTS
+        try:
+            resp = await client.get(url)
+            resp.raise_for_status()
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+            delay = _retry_delay(attempt, None)
+        except httpx.HTTPStatusError as exc:
+            if last_attempt or exc.response.status_code not in _RETRY_STATUSES:
+                raise
+            delay = _retry_delay(attempt, exc.response)
+        else:
+            return _json_loads(resp.content)
+
+        logger.warning(
+            "retrying GET %s in %.2fs (attempt %d/%d)",
+            path, delay, attempt + 1, _MAX_ATTEMPTS,
+        )
+        await asyncio.sleep(delay)
+
+    raise AssertionError("unreachable")  # loop always returns or raises
+
+
+async def _public_get(path: str) -> Any:
+    """GET a public endpoint through the in-process TTL cache.
+
+    Concurrent callers for the same path share one in-flight request
+    (single-flight via a per-path lock), and on network failure the last
+    cached value is served stale rather than raising.
+    """
+    ttl = _PUBLIC_TTL.get(path.partition("/")[0], 0.0)
+    if not ttl:
+        return await _fetch_public(path)
+
+    entry = _public_cache.get(path)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+
+    lock = _public_locks.setdefault(path, asyncio.Lock())
+    async with lock:
+        # Re-check: another caller may have refreshed while we waited.
+        entry = _public_cache.get(path)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        disk_ttl = _DISK_TTL.get(path)
+        if disk_ttl is not None:
+            value = await asyncio.to_thread(_disk_cache_read, path)
+            if value is not None:
+                _public_cache[path] = (time.monotonic(), value)
+                return value
+
+        try:
+            value = await _fetch_public(path)
+        except httpx.TransportError:
+            if entry is not None:
+                logger.warning("public GET %s failed; serving stale cached value", path)
+                return entry[1]
+            raise
+        except httpx.HTTPStatusError as exc:
+            # Only transient upstream statuses fall back to stale data; a
+            # permanent client error (400/404/...) must surface, not be
+            # masked by the cache forever.
+            if entry is not None and exc.response.status_code in _RETRY_STATUSES:
+                logger.warning("public GET %s failed; serving stale cached value", path)
+                return entry[1]
+            raise
+        _public_cache[path] = (time.monotonic(), value)
+        if disk_ttl is not None:
+            await asyncio.to_thread(_disk_cache_write, path, value, disk_ttl)
+        return value
+
+@mcp.tool()
+async def clear_cache() -> Dict[str, Any]:
+    """Clear the in-memory and on-disk caches for public endpoints."""
+    _public_cache.clear()
+    removed = await asyncio.to_thread(_disk_cache_clear)
+    return {"success": 1, "removed_files": removed}
 
 @mcp.tool()
 async def server_time() -> Dict[str, Any]:
@@ -145,10 +675,38 @@ async def trades(pair_id: str | None = None) -> list[Dict[str, Any]]:
 # MCP tools – one per documented method parameter
 # ---------------------------------------------------------------------------
 
+# Catch bad enum-like arguments locally instead of paying a signed HTTPS
+# round-trip just to receive the server's error response.
+_SIDES = frozenset({"buy", "sell"})
+_ORDERS = frozenset({"asc", "desc"})
+
+_known_pairs: tuple[float, frozenset] | None = None
+
+
+def _validate_pair(pair: str) -> None:
+    """Raise ValueError for a pair the exchange does not list.
+
+    Only enforced when pair metadata is already in the TTL cache (warmed by
+    the `pairs` tool or a previous call); validation never triggers a
+    network request of its own.
+    """
+    global _known_pairs
+    entry = _public_cache.get("pairs")
+    if entry is None:
+        return
+    if _known_pairs is None or _known_pairs[0] != entry[0]:
+        tickers = frozenset(
+            p["ticker_id"] for p in entry[1] if isinstance(p, dict) and "ticker_id" in p
+        )
+        _known_pairs = (entry[0], tickers)
+    known = _known_pairs[1]
+    if known and pair not in known:
+        raise ValueError(f"unknown pair {pair!r}; see the pairs tool for valid ticker ids")
+
 @mcp.tool()
 async def get_info() -> Dict[str, Any]:
     """Get user balances, server time, addresses etc. Equivalent to `getInfo`."""
-    return await _private_post({"method": "getInfo"})
+    return await _private_post(_GETINFO_PAYLOAD)
 
 
 @mcp.tool()
@@ -157,12 +715,7 @@ async def trans_history(start: Optional[str] = None, end: Optional[str] = None)
 
     Defaults to the last 7 days when no dates specified (server behaviour).
     """
-    payload: Dict[str, Any] = {"method": "transHistory"}
-    if start:
-        payload["start"] = start
-    if end:
-        payload["end"] = end
-    return await _private_post(payload)
+    return await _private_post(_build_payload("transHistory", start=start, end=end))
 
 
 @mcp.tool()
@@ -176,17 +729,12 @@ async def trade(pair: str, type: str, price: float, idr: Optional[float] = None,
         idr: Amount in IDR (for buy orders).
         crypto: Amount in crypto (for sell orders).
     """
-    payload: Dict[str, Any] = {
-        "method": "trade",
-        "pair": pair,
-        "type": type,
-        "price": price,
-    }
-    if idr is not None:
-        payload["idr"] = idr
-    if crypto is not None:
-        payload["crypto"] = crypto
-    return await _private_post(payload)
+    if type not in _SIDES:
+        raise ValueError(f"type must be 'buy' or 'sell', got {type!r}")
+    _validate_pair(pair)
+    return await _private_post(
+        _build_payload("trade", pair=pair, type=type, price=price, idr=idr, crypto=crypto)
+    )
 
 
 @mcp.tool()
@@ -200,44 +748,35 @@ async def trade_history(pair: Optional[str] = None, count: int = 100, from_id: O
         end_id: End ID.
         order: "asc" or "desc".
     """
-    payload: Dict[str, Any] = {
-        "method": "tradeHistory",
-        "count": count,
-        "order": order,
-    }
+    if order not in _ORDERS:
+        raise ValueError(f"order must be 'asc' or 'desc', got {order!r}")
     if pair:
-        payload["pair"] = pair
-    if from_id is not None:
-        payload["from"] = from_id
-    if end_id is not None:
-        payload["end"] = end_id
-    return await _private_post(payload)
+        _validate_pair(pair)
+    return await _private_post(
+        _build_payload(
+            "tradeHistory", count=count, order=order, pair=pair, from_id=from_id, end_id=end_id
+        )
+    )
 
 
 @mcp.tool()
 async def open_orders(pair: Optional[str] = None) -> Dict[str, Any]:
     """Get open orders. Optionally filter by pair."""
-    payload: Dict[str, Any] = {"method": "openOrders"}
-    if pair:
-        payload["pair"] = pair
-    return await _private_post(payload)
+    return await _private_post(_build_payload("openOrders", pair=pair))
 
 
 @mcp.tool()
 async def order_history(pair: Optional[str] = None, count: int = 100, from_id: Optional[int] = None, end_id: Optional[int] = None, order: str = "desc") -> Dict[str, Any]:
     """Fetch order history."""
-    payload: Dict[str, Any] = {
-        "method": "orderHistory",
-        "count": count,
-        "order": order,
-    }
+    if order not in _ORDERS:
+        raise ValueError(f"order must be 'asc' or 'desc', got {order!r}")
     if pair:
-        payload["pair"] = pair
-    if from_id is not None:
-        payload["from"] = from_id
-    if end_id is not None:
-        payload["end"] = end_id
-    return await _private_post(payload)
+        _validate_pair(pair)
+    return await _private_post(
+        _build_payload(
+            "orderHistory", count=count, order=order, pair=pair, from_id=from_id, end_id=end_id
+        )
+    )
 
 
 @mcp.tool()
@@ -274,37 +813,32 @@ async def withdraw_fee(currency: str, amount: float, address: str, network: Opti
         address: Destination address.
         network: Optional network code (e.g. "erc20").
     """
-    payload: Dict[str, Any] = {
-        "method": "withdrawFee",
-        "currency": currency,
-        "amount": amount,
-        "address": address,
-    }
-    if network:
-        payload["network"] = network
-    return await _private_post(payload)
+    return await _private_post(
+        _build_payload(
+            "withdrawFee", currency=currency, amount=amount, address=address, network=network
+        )
+    )
 
 
 @mcp.tool()
 async def withdraw_coin(currency: str, amount: float, address: str, network: Optional[str] = None, memo: Optional[str] = None) -> Dict[str, Any]:
     """Perform a crypto withdrawal."""
-    payload: Dict[str, Any] = {
-        "method": "withdrawCoin",
-        "currency": currency,
-        "amount": amount,
-        "address": address,
-    }
-    if network:
-        payload["network"] = network
-    if memo:
-        payload["memo"] = memo
-    return await _private_post(payload)
+    return await _private_post(
+        _build_payload(
+            "withdrawCoin",
+            currency=currency,
+            amount=amount,
+            address=address,
+            network=network,
+            memo=memo,
+        )
+    )
 
 
 @mcp.tool()
 async def list_downline() -> Dict[str, Any]:
     """List referral downlines (Partner only)."""
-    return await _private_post({"method": "listDownline"})
+    return await _private_post(_LISTDOWNLINE_PAYLOAD)
 
 
 @mcp.tool()
@@ -316,10 +850,9 @@ async def check_downline(username: str) -> Dict[str, Any]:
 @mcp.tool()
 async def create_voucher(amount: float, description: str | None = None) -> Dict[str, Any]:
     """Create a voucher (Partner only)."""
-    payload: Dict[str, Any] = {"method": "createVoucher", "amount": amount}
-    if description:
-        payload["description"] = description
-    return await _private_post(payload)
+    return await _private_post(
+        _build_payload("createVoucher", amount=amount, description=description)
+    )
 
 
 # ---------------------------------------------------------------------------